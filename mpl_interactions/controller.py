@@ -20,6 +20,7 @@ from .helpers import (
     kwarg_to_mpl_widget,
     notebook_backend,
     process_mpl_widget,
+    throttle,
 )
 
 
@@ -214,12 +215,22 @@ class Controls:
                 callback(**{key: self.params[key] for key in params})
         self._register_function(callback, fig=None, params=params)
 
-    def _register_function(self, f, fig=None, params=None):
+    def _register_function(
+        self, f, fig=None, params=None, redraw=True, max_fps=None, defer_updates=False
+    ):
         """
         if params is None use the entire current set of params
+        if redraw is False then *f* is responsible for updating the canvas of *fig*
+        itself (e.g. by blitting) and draw_idle will not be called on its behalf.
+        if max_fps is given then *f* will be throttled to run at most that many times
+        per second. if defer_updates is True *f* will be run from a timer on the canvas
+        with stale updates dropped. see `mpl_interactions.helpers.throttle`.
         """
         if params is None:
             params = self.params.keys()
+        if (max_fps is not None or defer_updates) and fig is not None:
+            f = throttle(f, fig, max_fps, redraw=redraw, defer=defer_updates)
+            redraw = False
         # listify to ensure it's not a reference to dicts keys
         # bc that's mutable
         params = list(params)
@@ -228,11 +239,21 @@ class Controls:
                 self._user_callbacks[p].append((f, params))
             else:
                 self._update_funcs[p].append((f, params))
-                if fig not in self.figs[p] and fig is not None:
+                if redraw and fig not in self.figs[p]:
                     self.figs[p].append(fig)  # maybe should use a weakref?
                     # also should probably register a close_event callback to remove
                     # the figure
 
+    def _flush_throttled(self):
+        """
+        Immediately run any updates that are waiting on a throttle timer.
+        """
+        for funcs in self._update_funcs.values():
+            for f, _ in funcs:
+                flush = getattr(f, "flush", None)
+                if flush is not None:
+                    flush()
+
     def save_animation(
         self, filename, fig, param, interval=20, func_anim_kwargs={}, N_frames=None, **kwargs
     ):
@@ -294,6 +315,8 @@ class Controls:
                 slider.value = val
             else:
                 slider.set_val(val)
+            # throttled functions may be holding onto this frame
+            self._flush_throttled()
             return []
 
         repeat = func_anim_kwargs.pop("repeat", False)
@@ -1,6 +1,7 @@
+import time
 from collections import defaultdict
 from collections.abc import Callable, Iterable
-from functools import partial
+from functools import lru_cache, partial
 from numbers import Number
 
 import matplotlib.widgets as mwidgets
@@ -12,6 +13,7 @@ try:
 except ImportError:
     pass
 from matplotlib import get_backend
+from matplotlib.backend_bases import TimerBase
 from matplotlib.pyplot import figure, gca, gcf, ioff
 from matplotlib.pyplot import sca as mpl_sca
 from numpy.distutils.misc_util import is_sequence
@@ -41,6 +43,7 @@ __all__ = [
     "create_mpl_controls_fig",
     "eval_xy",
     "choose_fmt_str",
+    "throttle",
 ]
 
 
@@ -123,8 +126,14 @@ def is_jagged(seq):
 def prep_broadcast(arr):
     if arr is None:
         return np.atleast_1d(None)
-    if is_jagged(arr):
-        arr = np.asarray(arr, dtype=np.object)
+    # arrays can't be jagged so skip that check for them
+    if not isinstance(arr, np.ndarray) and is_jagged(arr):
+        # fill element by element so numpy doesn't try to broadcast the contents
+        # np.object was removed in numpy 1.24 so use the builtin
+        jagged = np.empty(len(arr), dtype=object)
+        for i, a in enumerate(arr):
+            jagged[i] = a
+        return jagged
     elif isinstance(arr, Number) or isinstance(arr, Callable):
         arr = np.atleast_1d(arr)
     else:
@@ -180,11 +189,9 @@ def broadcast_many(*args):
     return broadcast_arrays(*[(prep_broadcast(arg[0]), arg[1]) for arg in args])
 
 
-def notebook_backend():
-    """
-    returns True if the backend is ipympl or nbagg, otherwise False
-    """
-    backend = get_backend().lower()
+@lru_cache(maxsize=None)
+def _is_notebook_backend(backend):
+    backend = backend.lower()
     if "ipympl" in backend:
         return True
     elif backend == "nbAgg".lower():
@@ -192,12 +199,21 @@ def notebook_backend():
     return False
 
 
+def notebook_backend():
+    """
+    returns True if the backend is ipympl or nbagg, otherwise False
+    """
+    # keyed on the backend name rather than cached outright so that
+    # switching with matplotlib.use is still picked up
+    return _is_notebook_backend(get_backend())
+
+
 def callable_else_value(arg, params, cache=None):
     """
     returns as a numpy array
     """
     if isinstance(arg, Callable):
-        if cache:
+        if cache is not None:
             if arg not in cache:
                 cache[arg] = np.asanyarray(arg(**params))
             return cache[arg]
@@ -212,7 +228,7 @@ def callable_else_value_no_cast(arg, params, cache=None):
     return (x, y) where it's handy to check if the return is a tuple
     """
     if isinstance(arg, Callable):
-        if cache:
+        if cache is not None:
             if arg not in cache:
                 cache[arg] = arg(**params)
             return cache[arg]
@@ -224,7 +240,7 @@ def callable_else_value_no_cast(arg, params, cache=None):
 def callable_else_value_wrapper(arg, params, cache=None):
     def f(params):
         if isinstance(arg, Callable):
-            if cache:
+            if cache is not None:
                 if arg not in cache:
                     cache[arg] = np.asanyarray(arg(**params))
                 return cache[arg]
@@ -245,27 +261,28 @@ def eval_xy(x_, y_, params, cache=None):
     x, y
         as numpy arrays
     """
+    if cache is not None:
+        # y may depend on x so key on the pair rather than on y_ alone
+        key = ("eval_xy", id(x_), id(y_))
+        if key in cache:
+            return cache[key]
     if isinstance(x_, Callable):
         if cache is not None:
-            if x_ in cache:
-                x = cache[x_]
-            else:
-                x = x_(**params)
+            if x_ not in cache:
+                cache[x_] = x_(**params)
+            x = cache[x_]
         else:
             x = x_(**params)
     else:
         x = x_
     if isinstance(y_, Callable):
-        if cache is not None:
-            if y_ in cache:
-                y = cache[y_]
-            else:
-                y = y_(x, **params)
-        else:
-            y = y_(x, **params)
+        y = y_(x, **params)
     else:
         y = y_
-    return np.asanyarray(x), np.asanyarray(y)
+    out = np.asanyarray(x), np.asanyarray(y)
+    if cache is not None:
+        cache[key] = out
+    return out
 
 
 def kwarg_to_ipywidget(key, val, update, slider_format_string, play_button=None):
@@ -658,25 +675,43 @@ def kwarg_to_mpl_widget(
             return val[0], slider, None, widget_y
 
 
-def create_slider_format_dict(slider_format_string):
-    if isinstance(slider_format_string, defaultdict):
-        return slider_format_string
-    elif isinstance(slider_format_string, dict) or slider_format_string is None:
-        slider_format_strings = defaultdict(lambda: "{:.2f}")
-        if slider_format_string is not None:
-            for key, val in slider_format_string.items():
-                slider_format_strings[key] = val
-    elif isinstance(slider_format_string, str):
+@lru_cache(maxsize=64)
+def _create_slider_format_dict(slider_format_string):
+    """
+    The cached part of `create_slider_format_dict`. Takes None, a str, or a frozenset
+    of the items of a dict.
+    """
+    if isinstance(slider_format_string, str):
 
         def f():
             return slider_format_string
 
-        slider_format_strings = defaultdict(f)
+        return defaultdict(f)
+    slider_format_strings = defaultdict(lambda: "{:.2f}")
+    if slider_format_string is not None:
+        for key, val in slider_format_string:
+            slider_format_strings[key] = val
+    return slider_format_strings
+
+
+def create_slider_format_dict(slider_format_string):
+    if isinstance(slider_format_string, defaultdict):
+        return slider_format_string
+    elif isinstance(slider_format_string, dict):
+        try:
+            key = frozenset(slider_format_string.items())
+        except TypeError:
+            # unhashable values, skip the cache
+            return _create_slider_format_dict.__wrapped__(slider_format_string.items())
+    elif isinstance(slider_format_string, str) or slider_format_string is None:
+        key = slider_format_string
     else:
         raise ValueError(
             f"slider_format_string must be a dict or a string but it is a {type(slider_format_string)}"
         )
-    return slider_format_strings
+    # copy because the controls add to and look up keys in the defaultdict
+    # which would otherwise leak between everything sharing the cached one
+    return _create_slider_format_dict(key).copy()
 
 
 def gogogo_figure(ipympl, ax=None):
@@ -739,3 +774,82 @@ def choose_fmt_str(dtype=None):
         fmt = r"{:}"
 
     return fmt
+
+
+def throttle(update, fig, max_fps=None, redraw=True, defer=False):
+    """
+    Wrap an update function so that it is run at most *max_fps* times per second
+    and/or so that it is run from the figure's event loop rather than directly from
+    the widget callback.
+
+    Calls that arrive too soon after the previous one are not run immediately.
+    Instead the most recent one is held onto and run by a timer from the figure's
+    canvas once enough time has passed, so the final state of the controls always
+    ends up being drawn. Any older pending call is dropped. A pending call can also
+    be run straight away with ``throttled.flush()``.
+
+    Non-interactive canvases (e.g. Agg or the inline backend) don't have a working
+    timer, so for those every call is run immediately, even if *defer* is True.
+
+    Parameters
+    ----------
+    update : callable
+        An update function accepting *params*, *indices*, and *cache*
+    fig : matplotlib figure
+        The figure that *update* modifies.
+    max_fps : float, optional
+        The maximum number of times per second to run *update*. If None there is
+        no limit.
+    redraw : bool, default: True
+        Whether to call ``fig.canvas.draw_idle`` after running *update*. The wrapped
+        function should be registered without a figure redraw as it handles it.
+    defer : bool, default: False
+        If True then *update* is never run directly, instead it is always scheduled
+        on a timer so that the widget callback returns immediately. Changes that
+        arrive before the timer fires replace the pending one rather than queueing up.
+        The update still runs on the GUI thread as matplotlib is not thread safe.
+
+    Returns
+    -------
+    throttled : callable
+    """
+    min_interval = 0 if max_fps is None else 1 / max_fps
+    last = -float("inf")
+    pending = None
+
+    def run(params, indices, cache):
+        nonlocal last, pending
+        pending = None
+        last = time.perf_counter()
+        update(params=params, indices=indices, cache=cache)
+        if redraw:
+            fig.canvas.draw_idle()
+
+    def flush():
+        if pending is not None:
+            timer.stop()
+            run(*pending)
+
+    timer = fig.canvas.new_timer()
+    timer.single_shot = True
+    timer.add_callback(flush)
+    # the base class timer never fires
+    has_timer = type(timer) is not TimerBase
+
+    def throttled(params, indices, cache):
+        nonlocal pending
+        elapsed = time.perf_counter() - last
+        if not has_timer or (elapsed >= min_interval and not defer):
+            timer.stop()
+            run(params, indices, cache)
+        else:
+            # keep the cache so other functions updating from the same event can share it
+            pending = (params, indices, cache)
+            if elapsed < min_interval:
+                interval = int(1000 * (min_interval - elapsed)) + 1
+            else:
+                interval = 0
+            timer.start(interval)
+
+    throttled.flush = flush
+    return throttled
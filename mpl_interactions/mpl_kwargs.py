@@ -108,7 +108,8 @@ Text_kwargs_list = [
     "transform",
     "url",
     "usetex",
-    "verticalalignment" "va",
+    "verticalalignment",
+    "va",
     "visible",
     "wrap",
     "x",
@@ -117,17 +118,24 @@ Text_kwargs_list = [
 ]
 
 
+# frozen versions of the above so that kwarg_popper only has to
+# do a set lookup per kwarg rather than scanning the full list
+Line2D_kwargs_set = frozenset(Line2D_kwargs_list)
+imshow_kwargs_set = frozenset(imshow_kwargs_list)
+collection_kwargs_set = frozenset(collection_kwargs_list)
+Text_kwargs_set = frozenset(Text_kwargs_list)
+
+
 def kwarg_popper(kwargs, mpl_kwargs):
     """
     This will not modify kwargs for you.
 
     Examples
     --------
-    kwargs, plot_kwargs = kwarg_popper(kwargs, plot_kwargs_list)
+    kwargs, plot_kwargs = kwarg_popper(kwargs, Line2D_kwargs_set)
     """
-    kwargs = dict(kwargs)
-    passthrough = {}
-    for k in mpl_kwargs:
-        if k in kwargs:
-            passthrough[k] = kwargs.pop(k)
+    if not isinstance(mpl_kwargs, (set, frozenset)):
+        mpl_kwargs = frozenset(mpl_kwargs)
+    passthrough = {k: v for k, v in kwargs.items() if k in mpl_kwargs}
+    kwargs = {k: v for k, v in kwargs.items() if k not in mpl_kwargs}
     return kwargs, passthrough
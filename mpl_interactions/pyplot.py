@@ -6,12 +6,14 @@ Matplotlib widgets."""
 
 from collections.abc import Callable
 from numbers import Number
+from string import Formatter
 
 import matplotlib.markers as mmarkers
 import numpy as np
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import PolyCollection
 from matplotlib.colors import to_rgba_array
-from matplotlib.patches import Rectangle
+from matplotlib.image import AxesImage
+from matplotlib.transforms import Bbox
 
 from .controller import gogogo_controls, prep_scalars
 from .helpers import (
@@ -25,13 +27,20 @@ from .helpers import (
     update_datalim_from_bbox,
 )
 from .mpl_kwargs import (
-    Line2D_kwargs_list,
-    Text_kwargs_list,
-    collection_kwargs_list,
-    imshow_kwargs_list,
+    Line2D_kwargs_set,
+    Text_kwargs_set,
+    collection_kwargs_set,
+    imshow_kwargs_set,
     kwarg_popper,
 )
 
+try:
+    from numba import config, njit, prange
+
+    _has_numba = True
+except ImportError:
+    _has_numba = False
+
 __all__ = [
     "interactive_plot",
     "interactive_hist",
@@ -45,6 +54,21 @@ __all__ = [
 ]
 
 
+# modes for the xlim and ylim arguments, resolved once so that update functions
+# only need to compare ints
+_LIM_FIXED, _LIM_AUTO, _LIM_STRETCH = 0, 1, 2
+
+
+def _lim_mode(lim, name):
+    if not isinstance(lim, str):
+        return _LIM_FIXED
+    if lim.lower() == "auto":
+        return _LIM_AUTO
+    elif lim.lower() == "stretch":
+        return _LIM_STRETCH
+    raise ValueError(f"{name} must be 'auto', 'stretch', or a tuple but it is {lim!r}")
+
+
 def interactive_plot(
     *args,
     parametric=False,
@@ -56,6 +80,8 @@ def interactive_plot(
     play_buttons=None,
     controls=None,
     display_controls=True,
+    max_fps=None,
+    defer_updates=False,
     **kwargs,
 ):
     """
@@ -110,6 +136,16 @@ def interactive_plot(
         controls
     display_controls : boolean
         Whether the controls should display on creation. Ignored if controls is specified.
+    max_fps : float, optional
+        If given, the plot will be updated at most this many times per second. Changes
+        to the controls that arrive faster than this are coalesced so that only the
+        latest one is drawn.
+    defer_updates : boolean, default: False
+        If True, updating the plot is scheduled on the figure's event loop instead of
+        being run inside the widget callback. Changes that arrive before the pending
+        update has run replace it, so stale states are skipped rather than backlogged.
+        Non-interactive backends (e.g. Agg) have no event loop to schedule on so there
+        updates are always run immediately.
 
     Returns
     -------
@@ -133,7 +169,7 @@ def interactive_plot(
         interactive_plot(x, f, tau=(0, np.pi, 1000))
 
     """
-    kwargs, plot_kwargs = kwarg_popper(kwargs, Line2D_kwargs_list)
+    kwargs, plot_kwargs = kwarg_popper(kwargs, Line2D_kwargs_set)
     x_and_y = False
     x = None
     fmt = None
@@ -157,6 +193,10 @@ def interactive_plot(
     else:
         raise ValueError(f"You passed in {len(args)} args, but no more than 3 is supported.")
 
+    xmode = _lim_mode(xlim, "xlim")
+    ymode = _lim_mode(ylim, "ylim")
+    need_relim = xmode != _LIM_FIXED or ymode != _LIM_FIXED
+
     ipympl = notebook_backend()
     ipympl or force_ipywidgets
     fig, ax = gogogo_figure(ipympl, ax=ax)
@@ -165,59 +205,80 @@ def interactive_plot(
         kwargs, controls, display_controls, slider_formats, play_buttons
     )
 
-    def update(params, indices, cache):
-        if x_and_y:
-            x_, y_ = eval_xy(x, y, params, cache)
-            # broadcast so that we can always index
-            if x_.ndim == 1:
-                x_ = np.broadcast_to(x_[:, None], (x_.shape[0], len(lines)))
-            if y_.ndim == 1:
-                y_ = np.broadcast_to(y_[:, None], (y_.shape[0], len(lines)))
-            for i, line in enumerate(lines):
-                line.set_data(x_[:, i], y_[:, i])
-        elif parametric:
-            # transpose to splat bc matplotlib considers columns of arrays to be
-            # the datasets
-            # I don't think it's possible to have multiple lines here
-            # assert len(lines) == 1
-            out = callable_else_value_no_cast(y, params, cache)
-            if isinstance(out, tuple):
-                pass
-            elif isinstance(out, np.ndarray):
-                # transpose bc set_data expects a different shape than plot
-                out = np.asanyarray(out).T
-            # else hope for the best lol
-            lines[0].set_data(*out)
-        else:
-            y_ = callable_else_value(y, params, cache)
-            if y_.ndim == 1:
-                y_ = np.broadcast_to(y_[:, None], (y_.shape[0], len(lines)))
-            for i, line in enumerate(lines):
-                line.set_ydata(y_[:, i])
-
-        cur_xlims = ax.get_xlim()
-        cur_ylims = ax.get_ylim()
-        ax.relim()  # this may be expensive? don't do if not necessary?
-        if ylim == "auto":
+    # The data and limit handling is decided by the arguments so pick the
+    # appropriate functions once here rather than branching on every update.
+    def update_xy(params, cache):
+        x_, y_ = eval_xy(x, y, params, cache)
+        # broadcast so that we can always index
+        if x_.ndim == 1:
+            x_ = np.broadcast_to(x_[:, None], (x_.shape[0], len(lines)))
+        if y_.ndim == 1:
+            y_ = np.broadcast_to(y_[:, None], (y_.shape[0], len(lines)))
+        for i, line in enumerate(lines):
+            line.set_data(x_[:, i], y_[:, i])
+
+    def update_parametric(params, cache):
+        # transpose to splat bc matplotlib considers columns of arrays to be
+        # the datasets
+        # I don't think it's possible to have multiple lines here
+        # assert len(lines) == 1
+        out = callable_else_value_no_cast(y, params, cache)
+        if isinstance(out, tuple):
+            pass
+        elif isinstance(out, np.ndarray):
+            # transpose bc set_data expects a different shape than plot
+            out = np.asanyarray(out).T
+        # else hope for the best lol
+        lines[0].set_data(*out)
+
+    def update_y(params, cache):
+        y_ = callable_else_value(y, params, cache)
+        if y_.ndim == 1:
+            y_ = np.broadcast_to(y_[:, None], (y_.shape[0], len(lines)))
+        for i, line in enumerate(lines):
+            line.set_ydata(y_[:, i])
+
+    def update_lims():
+        ax.relim()
+        if xmode == _LIM_STRETCH or ymode == _LIM_STRETCH:
+            x0, y0, x1, y1 = ax.dataLim.extents
+        if ymode == _LIM_AUTO:
             ax.autoscale_view(scalex=False)
-        elif ylim == "stretch":
-            new_lims = [ax.dataLim.y0, ax.dataLim.y0 + ax.dataLim.height]
-            new_lims = [
-                new_lims[0] if new_lims[0] < cur_ylims[0] else cur_ylims[0],
-                new_lims[1] if new_lims[1] > cur_ylims[1] else cur_ylims[1],
-            ]
-            ax.set_ylim(new_lims)
-        if xlim == "auto":
+        elif ymode == _LIM_STRETCH:
+            cur_ylims = ax.get_ylim()
+            lo, hi = min(y0, cur_ylims[0]), max(y1, cur_ylims[1])
+            # setting the limits invalidates the axes so only do so if they changed
+            if lo != cur_ylims[0] or hi != cur_ylims[1]:
+                ax.set_ylim(lo, hi)
+        if xmode == _LIM_AUTO:
             ax.autoscale_view(scaley=False)
-        elif xlim == "stretch":
-            new_lims = [ax.dataLim.x0, ax.dataLim.x0 + ax.dataLim.width]
-            new_lims = [
-                new_lims[0] if new_lims[0] < cur_xlims[0] else cur_xlims[0],
-                new_lims[1] if new_lims[1] > cur_xlims[1] else cur_xlims[1],
-            ]
-            ax.set_xlim(new_lims)
+        elif xmode == _LIM_STRETCH:
+            cur_xlims = ax.get_xlim()
+            lo, hi = min(x0, cur_xlims[0]), max(x1, cur_xlims[1])
+            if lo != cur_xlims[0] or hi != cur_xlims[1]:
+                ax.set_xlim(lo, hi)
+
+    if x_and_y:
+        update_data = update_xy
+    elif parametric:
+        update_data = update_parametric
+    else:
+        update_data = update_y
+
+    if need_relim:
+
+        def update(params, indices, cache):
+            update_data(params, cache)
+            update_lims()
+
+    else:
+        # both limits are fixed so there's no need to recompute the datalims
+        def update(params, indices, cache):
+            update_data(params, cache)
 
-    controls._register_function(update, fig, params.keys())
+    controls._register_function(
+        update, fig, params.keys(), max_fps=max_fps, defer_updates=defer_updates
+    )
 
     if x_and_y:
         x_, y_ = eval_xy(x, y, params)
@@ -256,9 +317,9 @@ def interactive_plot(
     except KeyError:
         pass
 
-    if not isinstance(xlim, str):
+    if xmode == _LIM_FIXED:
         ax.set_xlim(xlim)
-    if not isinstance(ylim, str):
+    if ymode == _LIM_FIXED:
         ax.set_ylim(ylim)
 
     # make sure the home button will work
@@ -270,33 +331,134 @@ def interactive_plot(
     return controls
 
 
+def _hist_fixed_edges(arr, edges, density=None, weights=None):
+    """
+    Equivalent to ``np.histogram(arr, bins=edges, ...)`` for a precomputed 1D array
+    of edges, but skips re-validating the edges on every call.
+    Values outside of the edges are ignored and the last bin is closed, same as numpy.
+    """
+    arr = np.ravel(arr)
+    nbins = len(edges) - 1
+    idx = np.searchsorted(edges, arr, side="right") - 1
+    # values equal to the last edge belong in the last bin
+    idx[arr == edges[-1]] = nbins - 1
+    keep = (idx >= 0) & (idx < nbins)
+    if weights is not None:
+        weights = np.ravel(weights)[keep]
+    counts = np.bincount(idx[keep], weights=weights, minlength=nbins)
+    if density:
+        return counts / np.diff(edges) / counts.sum(), edges
+    return counts, edges
+
+
+# below this size the numpy version is already fast enough that spinning up
+# threads isn't worth it
+_NUMBA_HIST_MIN_SIZE = 100_000
+
+if _has_numba:
+    # a plain int so that it gets frozen into the compiled kernel and caching still works
+    _NUMBA_NUM_THREADS = config.NUMBA_NUM_THREADS
+
+    # no signature so that compilation waits until the first histogram rather than
+    # slowing down import, after that the compiled version is loaded from the cache
+    @njit(parallel=True, cache=True)
+    def _hist_uniform_numba(arr, lo, hi, nbins, counts):
+        """
+        Count *arr* into *nbins* uniform bins spanning [lo, hi] in a single pass.
+        Each thread fills its own partial histogram which are summed at the end.
+        Bin assignment matches the edge corrections done by `numpy.histogram`.
+        """
+        n = arr.shape[0]
+        nchunks = _NUMBA_NUM_THREADS
+        chunk = (n + nchunks - 1) // nchunks
+        step = (hi - lo) / nbins
+        norm = nbins / (hi - lo)
+        partial = np.zeros((nchunks, nbins), dtype=np.int64)
+        for c in prange(nchunks):
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                v = arr[i]
+                if v < lo or v > hi:
+                    continue
+                j = int((v - lo) * norm)
+                if j >= nbins:
+                    j = nbins - 1
+                if j > 0 and v < j * step + lo:
+                    j -= 1
+                elif j < nbins - 1 and v >= (j + 1) * step + lo:
+                    j += 1
+                partial[c, j] += 1
+        for c in range(nchunks):
+            for j in range(nbins):
+                counts[j] += partial[c, j]
+
+
+def _hist_int_bins_numba(arr, nbins, density=None):
+    """
+    Equivalent to ``np.histogram(arr, bins=nbins, density=density)`` using the
+    numba kernel. Returns None if the data isn't suitable so the caller can fall
+    back to numpy.
+    """
+    arr = np.ravel(arr)
+    # numpy computes the edges in the dtype of the data so for anything lower precision
+    # than float64 (e.g. float32) the bins could differ from the float64 kernel
+    if (arr.dtype.kind not in "iu" and arr.dtype != np.float64) or (
+        arr.size < _NUMBA_HIST_MIN_SIZE
+    ):
+        return None
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+    lo, hi = arr.min(), arr.max()
+    if not (np.isfinite(lo) and np.isfinite(hi)):
+        # let numpy raise its error about the range
+        return None
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    counts = np.zeros(nbins, dtype=np.int64)
+    _hist_uniform_numba(arr, lo, hi, nbins, counts)
+    edges = np.linspace(lo, hi, nbins + 1)
+    if density:
+        return counts / np.diff(edges) / counts.sum(), edges
+    return counts, edges
+
+
 def simple_hist(arr, bins="auto", density=None, weights=None):
-    heights, bins = np.histogram(arr, bins=bins, density=density, weights=weights)
-    width = bins[1] - bins[0]
-    new_patches = []
-    for i in range(len(heights)):
-        new_patches.append(Rectangle((bins[i], 0), width=width, height=heights[i]))
+    out = None
+    if isinstance(bins, np.ndarray) and bins.ndim == 1:
+        out = _hist_fixed_edges(arr, bins, density=density, weights=weights)
+    elif _has_numba and isinstance(bins, (int, np.integer)) and weights is None:
+        out = _hist_int_bins_numba(arr, int(bins), density=density)
+    if out is not None:
+        heights, bins = out
+    else:
+        heights, bins = np.histogram(arr, bins=bins, density=density, weights=weights)
+    # build the vertices of every bar at once rather than creating a Rectangle per bin
+    # shape is (nbins, 4, 2) which is what PolyCollection.set_verts expects
+    lefts = bins[:-1]
+    rights = bins[1:]
+    zeros = np.zeros_like(heights, dtype=float)
+    verts = np.stack(
+        [
+            np.column_stack([lefts, zeros]),
+            np.column_stack([rights, zeros]),
+            np.column_stack([rights, heights]),
+            np.column_stack([lefts, heights]),
+        ],
+        axis=1,
+    )
     xlims = (bins.min(), bins.max())
     ylims = (0, heights.max() * 1.05)
 
-    return xlims, ylims, new_patches
+    return xlims, ylims, verts
 
 
 def stretch(ax, xlims, ylims):
     cur_xlims = ax.get_xlim()
     cur_ylims = ax.get_ylim()
-    new_lims = ylims
-    new_lims = [
-        new_lims[0] if new_lims[0] < cur_ylims[0] else cur_ylims[0],
-        new_lims[1] if new_lims[1] > cur_ylims[1] else cur_ylims[1],
-    ]
-    ax.set_ylim(new_lims)
-    new_lims = xlims
-    new_lims = [
-        new_lims[0] if new_lims[0] < cur_xlims[0] else cur_xlims[0],
-        new_lims[1] if new_lims[1] > cur_xlims[1] else cur_xlims[1],
-    ]
-    ax.set_xlim(new_lims)
+    lo, hi = min(ylims[0], cur_ylims[0]), max(ylims[1], cur_ylims[1])
+    if lo != cur_ylims[0] or hi != cur_ylims[1]:
+        ax.set_ylim(lo, hi)
+    lo, hi = min(xlims[0], cur_xlims[0]), max(xlims[1], cur_xlims[1])
+    if lo != cur_xlims[0] or hi != cur_xlims[1]:
+        ax.set_xlim(lo, hi)
 
 
 def interactive_hist(
@@ -310,6 +472,8 @@ def interactive_hist(
     play_buttons=False,
     controls=None,
     display_controls=True,
+    max_fps=None,
+    defer_updates=False,
     **kwargs,
 ):
     """
@@ -326,7 +490,8 @@ def interactive_hist(
     density : bool, optional
         whether to plot as a probability density. Passed to `numpy.histogram`
     bins : int or sequence of scalars or str, optional
-        bins argument to `numpy.histogram`
+        bins argument to `numpy.histogram`. If numba is installed then histograms of
+        large arrays with an int number of bins will be computed with a numba kernel.
     weights : array_like, optional
         passed to `numpy.histogram`
     ax : matplotlib axis, optional
@@ -353,6 +518,16 @@ def interactive_hist(
         controls
     display_controls : boolean
         Whether the controls should display on creation. Ignored if controls is specified.
+    max_fps : float, optional
+        If given, the plot will be updated at most this many times per second. Changes
+        to the controls that arrive faster than this are coalesced so that only the
+        latest one is drawn.
+    defer_updates : boolean, default: False
+        If True, updating the plot is scheduled on the figure's event loop instead of
+        being run inside the widget callback. Changes that arrive before the pending
+        update has run replace it, so stale states are skipped rather than backlogged.
+        Non-interactive backends (e.g. Agg) have no event loop to schedule on so there
+        updates are always run immediately.
 
     Returns
     -------
@@ -374,6 +549,15 @@ def interactive_hist(
             return np.random.randn(1000)*scale + loc
         interactive_hist(f, loc=(-5, 5, 500), scale=(1, 10, 100))
     """
+    if not isinstance(bins, (str, Number)):
+        # explicit edges won't change between updates so only convert and validate
+        # them once and let simple_hist use the fast path for fixed edges
+        bins = np.asarray(bins, dtype=float)
+        if bins.ndim != 1:
+            raise ValueError("`bins` must be 1d, when an array")
+        # same check as numpy which allows repeated edges
+        if np.any(bins[:-1] > bins[1:]):
+            raise ValueError("`bins` must increase monotonically, when an array")
 
     ipympl = notebook_backend()
     fig, ax = gogogo_figure(ipympl, ax=ax)
@@ -382,23 +566,25 @@ def interactive_hist(
     controls, params = gogogo_controls(
         kwargs, controls, display_controls, slider_formats, play_buttons
     )
-    pc = PatchCollection([])
+    pc = PolyCollection([])
     ax.add_collection(pc, autolim=True)
 
     def update(params, indices, cache):
         arr_ = callable_else_value(arr, params, cache)
-        new_x, new_y, new_patches = simple_hist(arr_, density=density, bins=bins, weights=weights)
+        new_x, new_y, new_verts = simple_hist(arr_, density=density, bins=bins, weights=weights)
         stretch(ax, new_x, new_y)
-        pc.set_paths(new_patches)
+        pc.set_verts(new_verts)
         ax.autoscale_view()
 
-    controls._register_function(update, fig, params.keys())
+    controls._register_function(
+        update, fig, params.keys(), max_fps=max_fps, defer_updates=defer_updates
+    )
 
-    new_x, new_y, new_patches = simple_hist(
+    new_x, new_y, new_verts = simple_hist(
         callable_else_value(arr, params), density=density, bins=bins, weights=weights
     )
     sca(ax)
-    pc.set_paths(new_patches)
+    pc.set_verts(new_verts)
     ax.set_xlim(new_x)
     ax.set_ylim(new_y)
 
@@ -427,6 +613,8 @@ def interactive_scatter(
     play_buttons=False,
     controls=None,
     display_controls=True,
+    max_fps=None,
+    defer_updates=False,
     **kwargs,
 ):
     """
@@ -485,27 +673,33 @@ def interactive_scatter(
         controls
     display_controls : boolean
         Whether the controls should display on creation. Ignored if controls is specified.
+    max_fps : float, optional
+        If given, the plot will be updated at most this many times per second. Changes
+        to the controls that arrive faster than this are coalesced so that only the
+        latest one is drawn.
+    defer_updates : boolean, default: False
+        If True, updating the plot is scheduled on the figure's event loop instead of
+        being run inside the widget callback. Changes that arrive before the pending
+        update has run replace it, so stale states are skipped rather than backlogged.
+        Non-interactive backends (e.g. Agg) have no event loop to schedule on so there
+        updates are always run immediately.
 
     Returns
     -------
     controls
     """
 
-    if isinstance(xlim, str):
-        stretch_x = xlim == "stretch"
-    else:
-        stretch_x = False
-
-    if isinstance(ylim, str) and ylim.lower() == "stretch":
-        stretch_y = True
-    else:
-        stretch_y = False
+    xmode = _lim_mode(xlim, "xlim")
+    ymode = _lim_mode(ylim, "ylim")
+    stretch_x = xmode == _LIM_STRETCH
+    stretch_y = ymode == _LIM_STRETCH
+    need_relim = xmode != _LIM_FIXED or ymode != _LIM_FIXED
 
     # yanked from https://github.com/matplotlib/matplotlib/blob/bcc1ce8461f5b6e874baaaa02ef776d0243a4abe/lib/matplotlib/axes/_axes.py#L4271-L4273
     facecolors = kwargs.pop("facecolor", facecolors)
     edgecolors = kwargs.pop("edgecolor", edgecolors)
 
-    kwargs, collection_kwargs = kwarg_popper(kwargs, collection_kwargs_list)
+    kwargs, collection_kwargs = kwarg_popper(kwargs, collection_kwargs_set)
 
     ipympl = notebook_backend()
     fig, ax = gogogo_figure(ipympl, ax)
@@ -523,60 +717,120 @@ def interactive_scatter(
     )
 
     def update(params, indices, cache):
+        p = param_excluder(params)
         if parametric:
-            out = callable_else_value_no_cast(x, param_excluder(params))
+            out = callable_else_value_no_cast(x, p, cache)
             if not isinstance(out, tuple):
                 out = np.asanyarray(out).T
             x_, y_ = out
         else:
-            x_, y_ = eval_xy(x, y, param_excluder(params), cache)
-        scatter.set_offsets(np.column_stack([x_, y_]))
-        c_ = check_callable_xy(c, x_, y_, param_excluder(params), cache)
-        s_ = check_callable_xy(s, x_, y_, param_excluder(params, "s"), cache)
-        ec_ = check_callable_xy(edgecolors, x_, y_, param_excluder(params), cache)
-        fc_ = check_callable_xy(facecolors, x_, y_, param_excluder(params), cache)
-        a_ = check_callable_alpha(alpha, param_excluder(params, "alpha"), cache)
-        marker_ = callable_else_value_no_cast(marker, param_excluder(params), cache)
+            x_, y_ = eval_xy(x, y, p, cache)
+        # collect everything and apply it with a single Artist.update so
+        # that the scatter is only marked as changed once
+        props = {"offsets": np.column_stack([x_, y_])}
+        c_ = check_callable_xy(c, x_, y_, p, cache)
+        s_ = check_callable_xy(s, x_, y_, params, cache, except_="s")
+        ec_ = check_callable_xy(edgecolors, x_, y_, p, cache)
+        fc_ = check_callable_xy(facecolors, x_, y_, p, cache)
+        a_ = check_callable_alpha(alpha, params, cache)
+        marker_ = callable_else_value_no_cast(marker, p, cache)
 
         if marker_ is not None:
             if not isinstance(marker_, mmarkers.MarkerStyle):
                 marker_ = mmarkers.MarkerStyle(marker_)
             path = marker_.get_path().transformed(marker_.get_transform())
-            scatter.set_paths((path,))
+            props["paths"] = (path,)
 
+        # same as matplotlib c takes precedence over facecolors
+        if fc_ is not None:
+            props["facecolor"] = fc_
         if c_ is not None:
-            try:
-                c_ = to_rgba_array(c_)
-            except ValueError:
-                try:
-                    c_ = scatter.cmap(c_)
-                except TypeError:
-                    raise ValueError(
-                        "If c is a function it must return either an RGB(A) array"
-                        "or a 1D array of valid color names or values to be colormapped"
-                    )
-            scatter.set_facecolor(c_)
+            prop, value = convert_c(c_, len(x_))
+            if prop == "array":
+                props["array"] = value
+            else:
+                # clear any array so that the draw doesn't recolor from stale values
+                props["array"] = None
+                props["facecolor"] = value
         if ec_ is not None:
-            scatter.set_edgecolor(ec_)
-        if fc_ is not None:
-            scatter.set_facecolor(c_)
+            props["edgecolor"] = ec_
         if s_ is not None:
             if isinstance(s_, Number):
                 s_ = np.broadcast_to(s_, (len(x_),))
-            scatter.set_sizes(s_)
+            props["sizes"] = s_
         if a_ is not None:
-            scatter.set_alpha(a_)
+            props["alpha"] = a_
+        scatter.update(props)
 
-        update_datalim_from_bbox(
-            ax, scatter.get_datalim(ax.transData), stretch_x=stretch_x, stretch_y=stretch_y
-        )
-        ax.autoscale_view()
+        if need_relim:
+            update_datalim_from_bbox(
+                ax, scatter.get_datalim(ax.transData), stretch_x=stretch_x, stretch_y=stretch_y
+            )
+            ax.autoscale_view()
 
-    controls._register_function(update, fig, params.keys())
+    controls._register_function(
+        update, fig, params.keys(), max_fps=max_fps, defer_updates=defer_updates
+    )
 
-    def check_callable_xy(arg, x, y, params, cache):
+    # (c, n, converted) from the last conversion so that a c that isn't a function
+    # only needs to be converted once
+    last_c = (None, None, None)
+
+    def is_colormappable(c_, n):
+        # same as matplotlib only values with one entry per point get colormapped
+        # so that e.g. a single RGB triple stays a single color
+        return (
+            isinstance(c_, np.ndarray)
+            and c_.ndim == 1
+            and c_.shape[0] == n
+            and np.issubdtype(c_.dtype, np.number)
+        )
+
+    def convert_c(c_, n):
+        """
+        Returns the property name and value to update the scatter with for *c_*.
+        Values to be colormapped are set as the scatter's array so that matplotlib
+        applies the norm and cmap when drawing, which also keeps colorbars in sync.
+        Anything else is converted to RGBA facecolors.
+        """
+        nonlocal last_c
+        if is_colormappable(c_, n):
+            return "array", c_
+        if c_ is last_c[0] and n == last_c[1]:
+            return last_c[2]
+        if (
+            isinstance(c_, np.ndarray)
+            and c_.ndim == 2
+            and c_.shape[1] in (3, 4)
+            and c_.dtype.kind == "f"
+        ):
+            # already RGB(A) - set_facecolor will do the validation
+            return "facecolor", c_
+        try:
+            # color names, or a plain list of values that still needs colormapping
+            converted = "facecolor", to_rgba_array(c_)
+        except ValueError:
+            values = np.asanyarray(c_)
+            if not is_colormappable(values, n):
+                raise ValueError(
+                    "If c is a function it must return either an RGB(A) array"
+                    "or a 1D array of valid color names or values to be colormapped"
+                )
+            converted = "array", values
+        if not isinstance(c, Callable):
+            # functions may hand back the same (modified) array so only cache fixed values
+            last_c = (c_, n, converted)
+        return converted
+
+    def check_callable_xy(arg, x, y, params, cache, except_=None):
+        """
+        If *except_* is given then *params* should be the full params and they
+        will only be filtered by param_excluder if *arg* actually needs calling.
+        """
         if isinstance(arg, Callable):
             if arg not in cache:
+                if except_ is not None:
+                    params = param_excluder(params, except_)
                 cache[arg] = arg(x, y, **params)
             return cache[arg]
         else:
@@ -599,7 +853,7 @@ def interactive_scatter(
     else:
         x_, y_ = eval_xy(x, y, p)
     c_ = check_callable_xy(c, x_, y_, p, {})
-    s_ = check_callable_xy(s, x_, y_, param_excluder(params, "s"), {})
+    s_ = check_callable_xy(s, x_, y_, params, {}, except_="s")
     ec_ = check_callable_xy(edgecolors, x_, y_, p, {})
     fc_ = check_callable_xy(facecolors, x_, y_, p, {})
     a_ = check_callable_alpha(alpha, params, {})
@@ -619,6 +873,10 @@ def interactive_scatter(
         label=label,
         **collection_kwargs,
     )
+    if xmode == _LIM_FIXED:
+        ax.set_xlim(xlim)
+    if ymode == _LIM_FIXED:
+        ax.set_ylim(ylim)
     # this is necessary to make calls to plt.colorbar behave as expected
     sca(ax)
     ax._sci(scatter)
@@ -651,6 +909,9 @@ def interactive_imshow(
     play_buttons=False,
     controls=None,
     display_controls=True,
+    max_fps=None,
+    defer_updates=False,
+    use_blit=False,
     **kwargs,
 ):
     """
@@ -708,6 +969,23 @@ def interactive_imshow(
         controls
     display_controls : boolean
         Whether the controls should display on creation. Ignored if controls is specified.
+    use_blit : boolean, default: False
+        If True and the canvas supports blitting then only the image, and whatever is
+        drawn on top of it in the same axes, will be redrawn when the controls change
+        rather than the entire figure. Anything outside of the image's axes that changes
+        with the controls will not be redrawn until the next full draw of the figure.
+        This includes colorbars and any other axes tied to the image's norm, as well as
+        other axes overlapping the image's axes.
+    max_fps : float, optional
+        If given, the plot will be updated at most this many times per second. Changes
+        to the controls that arrive faster than this are coalesced so that only the
+        latest one is drawn.
+    defer_updates : boolean, default: False
+        If True, updating the plot is scheduled on the figure's event loop instead of
+        being run inside the widget callback. Changes that arrive before the pending
+        update has run replace it, so stale states are skipped rather than backlogged.
+        Non-interactive backends (e.g. Agg) have no event loop to schedule on so there
+        updates are always run immediately.
 
     Returns
     -------
@@ -717,7 +995,14 @@ def interactive_imshow(
     fig, ax = gogogo_figure(ipympl, ax)
     ipympl or force_ipywidgets
     slider_formats = create_slider_format_dict(slider_formats)
-    kwargs, imshow_kwargs = kwarg_popper(kwargs, imshow_kwargs_list)
+    kwargs, imshow_kwargs = kwarg_popper(kwargs, imshow_kwargs_set)
+    blit = use_blit and getattr(fig.canvas, "supports_blit", False)
+    # the background of the axes without the image, filled in on every full draw
+    background = None
+    # everything in the axes that is drawn on top of the image
+    above = []
+    # the axes bbox expanded to whole pixels so partially covered edge pixels are included
+    region = None
 
     funcs, extra_ctrls, param_excluder = prep_scalars(kwargs, vmin=vmin, vmax=vmax, alpha=alpha)
     vmin = funcs["vmin"]
@@ -743,29 +1028,68 @@ def interactive_imshow(
         def vmax(**kwargs):
             return kwargs["vmax"]
 
+    # these only depend on the arguments so check them once rather than every update
+    X_is_func = isinstance(X, Callable)
+    vmin_is_func = isinstance(vmin, Callable)
+    vmax_is_func = isinstance(vmax, Callable)
+    alpha_is_func = isinstance(alpha, Callable)
+    autoscale = autoscale_cmap and vmin is None and vmax is None
+
     def update(params, indices, cache):
-        if isinstance(X, Callable):
+        props = {}
+        clim = [None, None]
+        if X_is_func:
             # ignore anything that we added directly to kwargs in prep_scalar
             # if we don't do this then we might pass the user a kwarg their function
             # didn't expect and things may break
             # check this here to avoid setting the data if we don't need to
             # use the callable_else_value fxn to make use of easy caching
             new_data = callable_else_value(X, param_excluder(params), cache)
-            im.set_data(new_data)
-            if autoscale_cmap and (new_data.ndim != 3) and vmin is None and vmax is None:
-                im.norm.autoscale(new_data)
+            props["data"] = new_data
+            if autoscale and new_data.ndim != 3:
+                # only touch the norm if the range actually changed to avoid
+                # triggering callbacks (e.g. colorbars) for no reason
+                lo, hi = new_data.min(), new_data.max()
+                if lo != im.norm.vmin or hi != im.norm.vmax:
+                    clim = [lo, hi]
         # caching for these?
-        if isinstance(vmin, Callable):
-            im.norm.vmin = callable_else_value(vmin, param_excluder(params, "vmin"), cache)
-        if isinstance(vmax, Callable):
-            im.norm.vmax = callable_else_value(vmax, param_excluder(params, "vmax"), cache)
+        if vmin_is_func:
+            clim[0] = callable_else_value(vmin, param_excluder(params, "vmin"), cache)
+        if vmax_is_func:
+            clim[1] = callable_else_value(vmax, param_excluder(params, "vmax"), cache)
+        if clim[0] is not None or clim[1] is not None:
+            # a None in clim leaves that limit unchanged
+            props["clim"] = tuple(clim)
         # Don't use callable_else_value to avoid unnecessary updates
         # Seems as though set_alpha doesn't short circuit if the value
         # hasn't been changed
-        if isinstance(alpha, Callable):
-            im.set_alpha(callable_else_value_no_cast(alpha, param_excluder(params, "alpha"), cache))
-
-    controls._register_function(update, fig, params.keys())
+        if alpha_is_func:
+            props["alpha"] = callable_else_value_no_cast(
+                alpha, param_excluder(params, "alpha"), cache
+            )
+        # apply everything at once so the image is only marked as changed once
+        im.update(props)
+        if blit:
+            if background is None:
+                # haven't had a full draw yet so nothing to blit onto
+                fig.canvas.draw_idle()
+            else:
+                canvas = fig.canvas
+                current = canvas.copy_from_bbox(fig.bbox)
+                canvas.restore_region(background)
+                ax.draw_artist(im)
+                for a in above:
+                    ax.draw_artist(a)
+                # things like tick labels stick out of the axes and are already drawn
+                # there so only keep the newly drawn pixels that are inside the axes
+                inside = canvas.copy_from_bbox(region)
+                canvas.restore_region(current)
+                canvas.restore_region(inside)
+                canvas.blit(region)
+
+    controls._register_function(
+        update, fig, params.keys(), redraw=not blit, max_fps=max_fps, defer_updates=defer_updates
+    )
 
     # make it once here so we can use the dims in update
     # see explanation for excluded_params in the update function
@@ -789,6 +1113,53 @@ def interactive_imshow(
         **imshow_kwargs,
     )
 
+    if blit:
+        canvas = fig.canvas
+
+        def split_draw_order():
+            """
+            The artists that `Axes.draw` draws before and after the image.
+            """
+            artists = [
+                a
+                for a in ax.get_children()
+                if a is not ax.patch and (not a.get_animated() or isinstance(a, AxesImage))
+            ]
+            if not (ax.axison and ax.get_frame_on()):
+                artists = [a for a in artists if a not in ax.spines.values()]
+            if not ax.axison:
+                artists = [a for a in artists if a not in (ax.xaxis, ax.yaxis)]
+            artists.sort(key=lambda a: a.zorder)
+            idx = artists.index(im)
+            first_above = idx + 1
+            return artists[:idx], artists[first_above:]
+
+        def on_draw(event):
+            nonlocal background, above, region
+            # savefig may draw with a temporary canvas (e.g. for pdf) that can't blit,
+            # and while saving there won't be any blitting to prepare for
+            if (
+                event.canvas is not canvas
+                or not hasattr(canvas, "copy_from_bbox")
+                or canvas.is_saving()
+            ):
+                return
+            below, above = split_draw_order()
+            # the image was drawn as normal, so to get the background without it
+            # redraw just what is underneath it then put the full draw back
+            full = canvas.copy_from_bbox(fig.bbox)
+            fig.patch.draw(event.renderer)
+            if ax.axison and ax.get_frame_on():
+                ax.patch.draw(event.renderer)
+            for a in below:
+                a.draw(event.renderer)
+            x0, y0, x1, y1 = ax.bbox.extents
+            region = Bbox.from_extents(np.floor(x0), np.floor(y0), np.ceil(x1), np.ceil(y1))
+            background = canvas.copy_from_bbox(region)
+            canvas.restore_region(full)
+
+        fig.canvas.mpl_connect("draw_event", on_draw)
+
     # i know it's bad news to use private methods :(
     # but idk how else to accomplish being a psuedo-pyplot
     ax._sci(im)
@@ -857,7 +1228,7 @@ def interactive_axhline(
     ipympl or force_ipywidgets
     slider_formats = create_slider_format_dict(slider_formats)
 
-    kwargs, line_kwargs = kwarg_popper(kwargs, Line2D_kwargs_list)
+    kwargs, line_kwargs = kwarg_popper(kwargs, Line2D_kwargs_set)
     line_kwargs.pop("transform", None)  # transform is not a valid kwarg for ax{v,h}line
 
     extra_ctrls = []
@@ -950,7 +1321,7 @@ def interactive_axvline(
     ipympl or force_ipywidgets
     slider_formats = create_slider_format_dict(slider_formats)
 
-    kwargs, line_kwargs = kwarg_popper(kwargs, Line2D_kwargs_list)
+    kwargs, line_kwargs = kwarg_popper(kwargs, Line2D_kwargs_set)
     line_kwargs.pop("transform", None)  # transform is not a valid kwarg for ax{v,h}line
 
     extra_ctrls = []
@@ -982,6 +1353,32 @@ def interactive_axvline(
     return controls
 
 
+def _referenced_params(text, params):
+    """
+    The params that are used by the format string *text*. If *text* is a function
+    then any param may be used so all of them are returned.
+    """
+    if isinstance(text, Callable):
+        return list(params)
+    fields = _format_fields(text)
+    return [p for p in params if p in fields]
+
+
+def _format_fields(text):
+    """
+    The names of all the fields in the format string *text*, including those nested
+    inside of format specs e.g. ``digits`` in ``{tau:.{digits}f}``.
+    """
+    fields = set()
+    for _, field_name, format_spec, _ in Formatter().parse(text):
+        if field_name:
+            # strip attribute access and indexing e.g. {volts.real} or {arr[0]}
+            fields.add(field_name.split(".")[0].split("[")[0])
+        if format_spec:
+            fields |= _format_fields(format_spec)
+    return fields
+
+
 def interactive_title(
     title,
     controls=None,
@@ -1047,7 +1444,7 @@ def interactive_title(
     ipympl or force_ipywidgets
     slider_formats = create_slider_format_dict(slider_formats)
 
-    kwargs, text_kwargs = kwarg_popper(kwargs, Text_kwargs_list)
+    kwargs, text_kwargs = kwarg_popper(kwargs, Text_kwargs_set)
 
     controls, params = gogogo_controls(
         kwargs, controls, display_controls, slider_formats, play_buttons
@@ -1063,7 +1460,8 @@ def interactive_title(
             **text_kwargs,
         )
 
-    controls._register_function(update, fig, params)
+    # only update when a param that actually appears in the title changes
+    controls._register_function(update, fig, _referenced_params(title, params))
     ax.set_title(
         callable_else_value_no_cast(title, params, None).format(**params),
         fontdict=fontdict,
@@ -1137,7 +1535,7 @@ def interactive_xlabel(
     ipympl or force_ipywidgets
     slider_formats = create_slider_format_dict(slider_formats)
 
-    kwargs, text_kwargs = kwarg_popper(kwargs, Text_kwargs_list)
+    kwargs, text_kwargs = kwarg_popper(kwargs, Text_kwargs_set)
     controls, params = gogogo_controls(
         kwargs, controls, display_controls, slider_formats, play_buttons
     )
@@ -1151,7 +1549,8 @@ def interactive_xlabel(
             **text_kwargs,
         )
 
-    controls._register_function(update, fig, params)
+    # only update when a param that actually appears in the xlabel changes
+    controls._register_function(update, fig, _referenced_params(xlabel, params))
     ax.set_xlabel(
         callable_else_value_no_cast(xlabel, params, None).format(**params),
         fontdict=fontdict,
@@ -1224,7 +1623,7 @@ def interactive_ylabel(
     ipympl or force_ipywidgets
     slider_formats = create_slider_format_dict(slider_formats)
 
-    kwargs, text_kwargs = kwarg_popper(kwargs, Text_kwargs_list)
+    kwargs, text_kwargs = kwarg_popper(kwargs, Text_kwargs_set)
     controls, params = gogogo_controls(
         kwargs, controls, display_controls, slider_formats, play_buttons
     )
@@ -1238,7 +1637,8 @@ def interactive_ylabel(
             **text_kwargs,
         )
 
-    controls._register_function(update, fig, params)
+    # only update when a param that actually appears in the ylabel changes
+    controls._register_function(update, fig, _referenced_params(ylabel, params))
     ax.set_ylabel(
         callable_else_value_no_cast(ylabel, params, None).format(**params),
         fontdict=fontdict,
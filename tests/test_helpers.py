@@ -1,8 +1,19 @@
 import matplotlib.pyplot as plt
 import numpy as np
+import pytest
+from matplotlib.backend_bases import TimerBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 
-from mpl_interactions.helpers import sca, update_datalim_from_bbox, update_datalim_from_xy
+from mpl_interactions.helpers import (
+    create_slider_format_dict,
+    eval_xy,
+    prep_broadcast,
+    sca,
+    throttle,
+    update_datalim_from_bbox,
+    update_datalim_from_xy,
+)
 
 
 def test_bbox_update():
@@ -52,3 +63,139 @@ def test_sca():
 
     # this shouldn't fail
     sca(ax)
+
+
+def test_eval_xy_cache():
+    calls = []
+
+    def f_x(tau):
+        calls.append("x")
+        return np.arange(5) * tau
+
+    def f_y(x, tau):
+        calls.append("y")
+        return x * 2
+
+    cache = {}
+    x1, y1 = eval_xy(f_x, f_y, {"tau": 2}, cache)
+    x2, y2 = eval_xy(f_x, f_y, {"tau": 2}, cache)
+    assert calls == ["x", "y"]
+    np.testing.assert_array_equal(x1, x2)
+    np.testing.assert_array_equal(y1, y2)
+
+    # same y function but with a different x should not reuse the cached y
+    x3, y3 = eval_xy(np.arange(3), f_y, {"tau": 2}, cache)
+    np.testing.assert_array_equal(y3, np.arange(3) * 2)
+
+
+class ManualTimer(TimerBase):
+    """
+    Stand in for a GUI timer that only fires when told to
+    """
+
+
+@pytest.fixture
+def manual_timer_fig():
+    """
+    A figure whose canvas hands out `ManualTimer`s, along with the list of timers
+    it has created.
+    """
+    fig = Figure()
+    timers = []
+
+    def capture_timer(*args, **kwargs):
+        timers.append(ManualTimer(*args, **kwargs))
+        return timers[-1]
+
+    fig.canvas.new_timer = capture_timer
+    return fig, timers
+
+
+def test_throttle(manual_timer_fig):
+    fig, timers = manual_timer_fig
+    calls = []
+
+    def update(params, indices, cache):
+        calls.append(params["a"])
+
+    throttled = throttle(update, fig, max_fps=1e-3)
+    throttled(params={"a": 1}, indices={}, cache={})
+    throttled(params={"a": 2}, indices={}, cache={})
+    throttled(params={"a": 3}, indices={}, cache={})
+    # only the first call runs immediately
+    assert calls == [1]
+    # then the timer runs the most recent call
+    timers[0]._on_timer()
+    assert calls == [1, 3]
+    throttled(params={"a": 4}, indices={}, cache={})
+    throttled.flush()
+    assert calls == [1, 3, 4]
+
+
+def test_throttle_agg():
+    # Agg has no working timer so nothing can be held back
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    calls = []
+
+    def update(params, indices, cache):
+        calls.append(params["a"])
+
+    throttled = throttle(update, fig, max_fps=1e-3)
+    throttled(params={"a": 1}, indices={}, cache={})
+    throttled(params={"a": 2}, indices={}, cache={})
+    assert calls == [1, 2]
+
+    deferred = throttle(update, fig, defer=True)
+    deferred(params={"a": 3}, indices={}, cache={})
+    assert calls == [1, 2, 3]
+
+
+def test_throttle_defer(manual_timer_fig):
+    fig, timers = manual_timer_fig
+    calls = []
+
+    def update(params, indices, cache):
+        calls.append(params["a"])
+
+    deferred = throttle(update, fig, defer=True)
+    deferred(params={"a": 1}, indices={}, cache={})
+    deferred(params={"a": 2}, indices={}, cache={})
+    # nothing runs inside the callback
+    assert calls == []
+    timers[0]._on_timer()
+    # stale update was dropped
+    assert calls == [2]
+
+
+def test_create_slider_format_dict_cache():
+    a = create_slider_format_dict({"tau": "{:.1f}"})
+    b = create_slider_format_dict({"tau": "{:.1f}"})
+    assert a is not b
+    assert a["tau"] == "{:.1f}"
+    assert a["beta"] == "{:.2f}"
+    a["tau"] = "{:.3f}"
+    assert b["tau"] == "{:.1f}"
+    assert "beta" not in b
+    assert create_slider_format_dict("{:.4f}")["x"] == "{:.4f}"
+    assert create_slider_format_dict(None)["x"] == "{:.2f}"
+    with pytest.raises(ValueError):
+        create_slider_format_dict(5)
+
+
+def test_prep_broadcast():
+    jagged = prep_broadcast([np.arange(3), np.arange(4)])
+    assert jagged.dtype == object
+    assert jagged.shape == (2,)
+    np.testing.assert_array_equal(jagged[1], np.arange(4))
+    assert prep_broadcast(np.arange(3)).shape == (1, 3)
+    assert prep_broadcast(5).shape == (1,)
+
+
+def test_notebook_backend(monkeypatch):
+    import mpl_interactions.helpers as helpers
+
+    monkeypatch.setattr(helpers, "get_backend", lambda: "module://ipympl.backend_nbagg")
+    assert helpers.notebook_backend()
+    monkeypatch.setattr(helpers, "get_backend", lambda: "agg")
+    assert not helpers.notebook_backend()
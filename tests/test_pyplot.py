@@ -1,11 +1,14 @@
+from io import BytesIO
+
 import matplotlib.pyplot as plt
 import numpy as np
+import pytest
 from matplotlib import __version__ as mpl_version
 from matplotlib.testing.decorators import check_figures_equal
 from packaging import version
 
 import mpl_interactions.ipyplot as iplt
-from mpl_interactions.pyplot import interactive_plot
+from mpl_interactions.pyplot import interactive_plot, simple_hist
 
 from ._util import set_param_values
 
@@ -25,6 +28,46 @@ def f_hist(loc, scale):
 #     _ = interactive_hist(f_hist, density=True, loc=(5.5, 100), scale=(10, 15), ax=test_ax)
 
 
+def test_simple_hist():
+    arr = f_hist(0, 1)
+    heights, bins = np.histogram(arr, bins=10)
+    xlims, ylims, verts = simple_hist(arr, bins=10)
+    assert verts.shape == (10, 4, 2)
+    np.testing.assert_allclose(verts[:, 0, 0], bins[:-1])
+    np.testing.assert_allclose(verts[:, 1, 0], bins[1:])
+    np.testing.assert_allclose(verts[:, 2, 1], heights)
+    assert xlims == (bins.min(), bins.max())
+    assert ylims == (0, heights.max() * 1.05)
+
+
+def test_simple_hist_fixed_edges():
+    arr = f_hist(0, 1)
+    weights = np.random.rand(arr.size)
+    edges = np.array([-2, -1, -0.5, 0, 0.25, 1, arr.max()])
+    for density in [False, True]:
+        heights, _ = np.histogram(arr, bins=edges, density=density, weights=weights)
+        _, _, verts = simple_hist(arr, bins=edges, density=density, weights=weights)
+        np.testing.assert_allclose(verts[:, 2, 1], heights)
+    plt.subplots()
+    with pytest.raises(ValueError, match="monotonically"):
+        iplt.hist(arr, bins=[1, 0, 2])
+    with pytest.raises(ValueError, match="1d"):
+        iplt.hist(arr, bins=[[0, 1, 2]])
+    plt.close()
+
+
+def test_simple_hist_numba():
+    pytest.importorskip("numba")
+    for dtype in [np.float64, np.float32, np.int64]:
+        arr = (np.random.randn(200_000) * 100).astype(dtype)
+        for density in [False, True]:
+            heights, bins = np.histogram(arr, bins=37, density=density)
+            xlims, _, verts = simple_hist(arr, bins=37, density=density)
+            np.testing.assert_array_equal(verts[:, 2, 1], heights)
+            np.testing.assert_array_equal(verts[:, 0, 0], bins[:-1])
+            assert xlims == (bins.min(), bins.max())
+
+
 def f1(x, tau, beta):
     return np.sin(x * tau) * x * beta
 
@@ -54,6 +97,21 @@ def test_multiple_functions():
     return fig
 
 
+def test_plot_max_fps_agg():
+    # no working timer on Agg so every change must still be drawn
+    fig, ax = plt.subplots()
+    ctrls = iplt.plot(x, f1, tau=tau, beta=beta, max_fps=5)
+    set_param_values(ctrls, {"tau": 6})
+    set_param_values(ctrls, {"tau": 8})
+    np.testing.assert_allclose(ax.lines[0].get_ydata(), f1(x, **ctrls.params))
+    iplt.plot(x, f2, defer_updates=True, controls=ctrls)
+    set_param_values(ctrls, {"tau": 9})
+    np.testing.assert_allclose(ax.lines[1].get_ydata(), f2(x, **ctrls.params))
+    for fig in ctrls.control_figures:
+        plt.close(fig)
+    plt.close()
+
+
 @check_figures_equal(extensions=["png"])
 def test_plot(fig_test, fig_ref):
     test_ax = fig_test.add_subplot()
@@ -111,3 +169,150 @@ def test_title():
     iplt.title("E={E:.2e}", controls=ctrls)
     assert ax.get_title() == expected
     plt.close()
+
+
+def test_scatter_fixed_lims():
+    fig, ax = plt.subplots()
+    ctrls = iplt.scatter(x, f1, tau=tau, beta=beta, xlim=(0, 1), ylim=(-2, 2))
+    set_param_values(ctrls, {"beta": 1, "tau": 10})
+    assert ax.get_xlim() == (0, 1)
+    assert ax.get_ylim() == (-2, 2)
+    for fig in ctrls.control_figures:
+        plt.close(fig)
+    plt.close()
+
+
+def test_imshow_blit():
+    def f(scale):
+        return np.arange(100).reshape(10, 10) * scale
+
+    def make(use_blit):
+        fig, ax = plt.subplots()
+        ctrls = iplt.imshow(f, scale=(1, 5), alpha=0.5, vmin=0, vmax=500, use_blit=use_blit)
+        # the overlay and spines must stay on top of the blitted image
+        ax.axhline(4.5, color="k", linewidth=5)
+        ax.set_title("title")
+        fig.canvas.draw()
+        return fig, ctrls
+
+    fig, ctrls = make(True)
+    ref_fig, ref_ctrls = make(False)
+    for scale in [4, 0, 2]:
+        set_param_values(ctrls, {"scale": scale})
+        set_param_values(ref_ctrls, {"scale": scale})
+        # with blitting there is no full draw, so the buffer is what's on screen
+        ref_fig.canvas.draw()
+        np.testing.assert_array_equal(
+            np.asarray(fig.canvas.buffer_rgba()), np.asarray(ref_fig.canvas.buffer_rgba())
+        )
+    fig.canvas.draw()
+    np.testing.assert_array_equal(
+        np.asarray(fig.canvas.buffer_rgba()), np.asarray(ref_fig.canvas.buffer_rgba())
+    )
+
+    # saving shouldn't try to blit and should match the non-blitted output
+    fig.savefig(BytesIO(), format="pdf")
+    images = []
+    for fig_ in [fig, ref_fig]:
+        buf = BytesIO()
+        fig_.savefig(buf, format="png")
+        buf.seek(0)
+        images.append(plt.imread(buf))
+    np.testing.assert_array_equal(*images)
+    for fig in ctrls.control_figures + ref_ctrls.control_figures:
+        plt.close(fig)
+    plt.close("all")
+
+
+@check_figures_equal(extensions=["png"])
+def test_scatter(fig_test, fig_ref):
+    test_ax = fig_test.add_subplot()
+    ctrls = iplt.scatter(x, f1, tau=tau, beta=beta, ax=test_ax)
+    set_param_values(ctrls, {"beta": 2, "tau": 7})
+    set_param_values(ctrls, {"beta": 1, "tau": 4})
+
+    ref_ax = fig_ref.add_subplot()
+    ref_ax.scatter(x, f1(x, **ctrls.params))
+    ref_ax.set_xlim(test_ax.get_xlim())
+    ref_ax.set_ylim(test_ax.get_ylim())
+    for fig in ctrls.control_figures:
+        plt.close(fig)
+
+
+def test_scatter_colors():
+    fig, ax = plt.subplots()
+
+    def f_c(x, y, tau, beta):
+        rgba = np.zeros((len(x), 4))
+        rgba[:, 0] = beta / 2
+        rgba[:, 3] = 1
+        return rgba
+
+    ctrls = iplt.scatter(x, f1, c=f_c, tau=tau, beta=beta)
+    set_param_values(ctrls, {"beta": 1, "tau": 4})
+    scat = ax.collections[0]
+    np.testing.assert_allclose(scat.get_facecolor()[:, 0], ctrls.params["beta"] / 2)
+
+    ctrls = iplt.scatter(x, f1, c="red", controls=ctrls)
+    set_param_values(ctrls, {"beta": 2, "tau": 5})
+    np.testing.assert_allclose(ax.collections[1].get_facecolor(), [[1, 0, 0, 1]])
+
+    def f_single(x, y, tau, beta):
+        return np.array([0.6, 0, 0])
+
+    ctrls = iplt.scatter(x, f1, c=f_single, controls=ctrls)
+    set_param_values(ctrls, {"beta": 1})
+    np.testing.assert_allclose(ax.collections[2].get_facecolor(), [[0.6, 0, 0, 1]])
+    for fig in ctrls.control_figures:
+        plt.close(fig)
+    plt.close()
+
+    # colormapped values on their own axes so nothing else is changing the colors
+    fig, ax = plt.subplots()
+
+    def f_vals(x, y, tau, beta):
+        return np.full(len(x), beta)
+
+    ctrls = iplt.scatter(x, f1, c=f_vals, vmin=0, vmax=10, tau=tau, beta=beta)
+    scat = ax.collections[0]
+    start = ctrls.params["beta"]
+    set_param_values(ctrls, {"beta": 20})
+    assert ctrls.params["beta"] != start
+    fig.canvas.draw()
+    expected = scat.cmap(np.full(len(x), ctrls.params["beta"] / 10))
+    np.testing.assert_allclose(scat.get_facecolor(), expected)
+    for fig in ctrls.control_figures:
+        plt.close(fig)
+    plt.close()
+
+
+def test_bad_lim():
+    fig, ax = plt.subplots()
+    with pytest.raises(ValueError, match="xlim"):
+        iplt.plot(x, f1, tau=tau, beta=beta, xlim="fixed")
+    plt.close()
+
+
+def test_title_referenced_params():
+    fig, ax = plt.subplots()
+    ctrls = iplt.plot(x, f1, tau=tau, beta=beta)
+    iplt.title("tau={tau:.1f}", controls=ctrls)
+    # the title should only be hooked up to tau
+    assert len(ctrls._update_funcs["beta"]) == 1
+    assert len(ctrls._update_funcs["tau"]) == 2
+    set_param_values(ctrls, {"tau": 7})
+    assert ax.get_title() == "tau={:.1f}".format(ctrls.params["tau"])
+    for fig in ctrls.control_figures:
+        plt.close(fig)
+    plt.close()
+
+
+def test_title_nested_format_spec():
+    fig, ax = plt.subplots()
+    ctrls = iplt.title("tau={tau:.{digits}f}", tau=(1, 2), digits=[1, 2, 3])
+    set_param_values(ctrls, {"digits": 2})
+    assert ctrls.params["digits"] == 3
+    assert ax.get_title() == "tau={:.3f}".format(ctrls.params["tau"])
+    for fig in ctrls.control_figures:
+        plt.close(fig)
+    plt.close()